@@ -1,10 +1,8 @@
-import re
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TypeAlias
 
-import src.consts as consts
-
 
 @dataclass
 class Card:
@@ -19,8 +17,7 @@ class Card:
     idolized_url: str
 
     def is_double_sized(self) -> bool:
-        pattern: re.Pattern[str] = re.compile(r"/2x/")
-        return pattern.search(self.normal_url) is not None
+        return "/2x/" in self.normal_url
 
     def get_urls(self) -> list[str]:
         return [self.normal_url, self.idolized_url]
@@ -34,14 +31,14 @@ class Card:
     def needs_update(self) -> bool:
         return not self.is_double_sized() and self.rarity != "Rare"
 
-    def get_paths(self, path: Path) -> list[Path]:
+    def get_paths(self, base_path: Path) -> list[Path]:
         file_name: str = f"{self.key}_{self.unit}_{self.idol}"
-        base_path: Path = path / consts.get_const(type(self), "RESULTS_DIR")
-
-        normal_path: str = f"{file_name}_Normal{Path(self.normal_url).suffix}"
-        idolized_path: str = normal_path.replace("Normal", "Idolized")
+        suffix: str = os.path.splitext(self.normal_url)[1]
 
-        return [base_path / normal_path, base_path / idolized_path]
+        return [
+            base_path / f"{file_name}_Normal{suffix}",
+            base_path / f"{file_name}_Idolized{suffix}",
+        ]
 
 
 @dataclass
@@ -50,8 +47,7 @@ class Still:
     url: str
 
     def is_double_sized(self) -> bool:
-        pattern: re.Pattern[str] = re.compile(r"/2x/")
-        return pattern.search(self.url) is not None
+        return "/2x/" in self.url
 
     def get_urls(self) -> list[str]:
         return [self.url]
@@ -62,11 +58,12 @@ class Still:
     def needs_update(self) -> bool:
         return not self.is_double_sized()
 
-    def get_paths(self, path: Path) -> list[Path]:
+    def get_paths(self, base_path: Path) -> list[Path]:
         file_name: str = f"{self.key}_Still"
-        base_path: Path = path / consts.get_const(type(self), "RESULTS_DIR")
 
-        return [base_path / f"{file_name}{Path(self.url).suffix}"]
+        suffix: str = os.path.splitext(self.url)[1]
+
+        return [base_path / f"{file_name}{suffix}"]
 
 
 Item: TypeAlias = Card | Still
@@ -6,27 +6,46 @@ from typing import Any, Coroutine
 
 import aiohttp
 
+import src.consts as consts
 import src.html_parser as parser
 import src.json_utils as json_utils
 from src.classes import Card, Item
 
+CHUNK_SIZE: int = 64 * 1024
+WRITE_BATCH_SIZE: int = 1024 * 1024
+
 
 class Downloader:
+    session: aiohttp.ClientSession
+
     def __init__(self, path: Path, img_type: type[Item]):
         self.path: Path = path.expanduser()
         self.objs: dict[int, Item] = {}
 
         self.img_type: type[Item] = img_type
-        self.session: aiohttp.ClientSession = aiohttp.ClientSession()
+        self.img_path: Path = self.path / consts.get_const(img_type, "RESULTS_DIR")
+        self.log_suffixes: tuple[str, ...] = (
+            (", normal", ", idolized") if img_type is Card else ("",)
+        )
 
         json_utils.load_cards(self.path, self.objs, self.img_type)
 
         self.list_parser = parser.ListParser(self.img_type)
         self.item_parser = getattr(parser, f"{img_type.__name__}Parser")()
 
-        self.updateables: list[int] = []
+        self.updateables: set[int] = set()
+        self.fresh_keys: set[int] = set()
+        self.semaphore: asyncio.Semaphore = asyncio.Semaphore(64)
 
     async def __aenter__(self) -> Downloader:
+        connector: aiohttp.TCPConnector = aiohttp.TCPConnector(
+            limit=256,
+            limit_per_host=64,
+            use_dns_cache=True,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+        )
+        self.session = aiohttp.ClientSession(connector=connector)
         self.list_parser.set_session(self.session)
         self.item_parser.set_session(self.session)
 
@@ -36,42 +55,49 @@ class Downloader:
         await self.session.close()
 
     async def request_from_server(self, dest: Path, url: str) -> None:
-        res: aiohttp.ClientResponse = await self.session.get(f"https:{url}")
-        if res.status == 200:
-            res_data: bytes = await res.read()
-            dest.parent.mkdir(exist_ok=True, parents=True)
-            with open(dest, "wb") as file:
-                file.write(res_data)
-
-    async def download_file(self, path: Path, item: Item, i: int) -> None:
+        async with self.session.get(f"https:{url}") as res:
+            if res.status == 200:
+                dest.parent.mkdir(exist_ok=True, parents=True)
+                part: Path = dest.with_name(f"{dest.name}.part")
+                with open(part, "wb") as file:
+                    buffer: bytearray = bytearray()
+                    async for chunk in res.content.iter_chunked(CHUNK_SIZE):
+                        buffer += chunk
+                        if len(buffer) >= WRITE_BATCH_SIZE:
+                            await asyncio.to_thread(file.write, buffer)
+                            buffer = bytearray()
+                    if buffer:
+                        await asyncio.to_thread(file.write, buffer)
+                part.replace(dest)
+
+    async def download_file(self, path: Path, url: str, item: Item, i: int) -> None:
         if not path.exists() or item.key in self.updateables:
-            await self.request_from_server(path, item.get_urls()[i])
+            await self.request_from_server(path, url)
 
-            message: str = f"Downloaded item {item.key}"
-            if isinstance(item, Card):
-                message += f", {'idolized' if i == 1 else 'normal'}"
-            message += "."
-
-            print(message)
+            print(f"Downloaded item {item.key}{self.log_suffixes[i]}.")
 
     async def update_if_needed(self, item: Item) -> None:
-        if item.needs_update():
-            _, updated_item = await self.item_parser.get_item(item.key)
+        if item.key not in self.fresh_keys and item.needs_update():
+            async with self.semaphore:
+                _, updated_item = await self.item_parser.get_item(item.key)
+
+            old_urls: list[str] = item.get_urls()
+            new_urls: list[str] = updated_item.get_urls()
 
-            if item.get_urls()[0] != updated_item.get_urls()[0]:
-                self.updateables.append(item.key)
+            if old_urls[0] != new_urls[0]:
+                self.updateables.add(item.key)
 
-            for i in range(len(item.get_urls())):
-                item.set_url(i, updated_item.get_urls()[i])
+            for i, url in enumerate(new_urls):
+                item.set_url(i, url)
 
     async def add_item_to_object_list(self, item: int) -> None:
         i, obj = await self.item_parser.get_item(item)
         self.objs[i] = obj
+        self.fresh_keys.add(i)
         print(f"Getting item {i}.")
 
-    async def get_page(self, idx: int) -> list[None]:
+    async def add_new_items(self, page: list[int]) -> list[None]:
         tasks: list[Coroutine[Any, Any, None]] = []
-        page: list[int] = await self.list_parser.get_page(idx)
         for item in page:
             if item not in self.objs:
                 tasks.append(self.add_item_to_object_list(item))
@@ -79,19 +105,28 @@ class Downloader:
         return res
 
     async def get_cards_from_parser(self) -> None:
-        num_pages: int = await self.list_parser.get_num_pages() + 1
-        current_num: int = 1
-        for _ in range(1, num_pages):
-            current_page: list[None] = await self.get_page(current_num)
-            if not current_page:
-                break
-            current_num += 1
+        num_pages: int = await self.list_parser.get_num_pages()
+        next_page: asyncio.Task[list[int]] = asyncio.create_task(
+            self.list_parser.get_page(1)
+        )
+        try:
+            for idx in range(1, num_pages + 1):
+                page: list[int] = await next_page
+                if idx < num_pages:
+                    next_page = asyncio.create_task(self.list_parser.get_page(idx + 1))
+
+                current_page: list[None] = await self.add_new_items(page)
+                if not current_page:
+                    break
+        finally:
+            next_page.cancel()
 
     async def get_images(self, item: Item) -> None:
-        paths: list[Path] = item.get_paths(self.path)
+        paths: list[Path] = item.get_paths(self.img_path)
+        urls: list[str] = item.get_urls()
         try:
             for i, path in enumerate(paths):
-                await self.download_file(path, item, i)
+                await self.download_file(path, urls[i], item, i)
         except aiohttp.ClientError as exception:
             print(f"Couldn't download card {item.key}: {exception}.")
 
@@ -106,12 +141,14 @@ class Downloader:
         await self.get_cards_from_parser()
 
         print("Checking if items can be updated to better resolution...")
+        tasks: list[Coroutine[Any, Any, None]] = []
         for _, item in self.objs.items():
-            await self.update_if_needed(item)
+            tasks.append(self.update_if_needed(item))
+        await asyncio.gather(*tasks, return_exceptions=False)
 
         self.update_json_file()
         print("Updated items database.")
 
     def update_json_file(self) -> None:
-        self.objs = dict(sorted(self.objs.items(), reverse=True))
+        self.objs = {key: self.objs[key] for key in sorted(self.objs, reverse=True)}
         json_utils.dump_to_file(json_utils.to_json(self.objs), self.path, self.img_type)
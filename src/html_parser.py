@@ -2,16 +2,48 @@ from __future__ import annotations
 
 import re
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, cast
 
 import aiohttp
-import bs4
+import lxml.etree
+import lxml.html
 
 import src.consts as consts
 
 if TYPE_CHECKING:
     from src.classes import Card, Item, Still
 
+_TOP_ITEM_CLASS: str = r"""(?<![\w-])class=["'][^"']*(?<![\w-])top-item(?![\w-])"""
+_LIST_HREF_RE: re.Pattern[str] = re.compile(
+    rf"""<([a-z][a-z0-9]*)\s[^>]*?{_TOP_ITEM_CLASS}[^"']*["'][^>]*>"""
+    rf"""([^<]*(?:<(?!a\s|[^>]*?{_TOP_ITEM_CLASS})[^<]*)*)"""
+    r"""<a\s[^>]*?(?<![\w-])href=["'][^"']*?/([0-9]+)/""",
+    re.IGNORECASE,
+)
+_TAG_RE: re.Pattern[str] = re.compile(r"<(/?)([a-z][a-z0-9]*)", re.IGNORECASE)
+_PAGE_PARAM_RE: re.Pattern[str] = re.compile(r"=([0-9]+)")
+
+
+def _stays_open(tag: str, markup: str) -> bool:
+    depth: int = 0
+    for match in _TAG_RE.finditer(markup):
+        if match.group(2).lower() == tag:
+            depth += -1 if match.group(1) else 1
+            if depth < 0:
+                return False
+    return True
+
+
+def _with_class(name: str) -> str:
+    return f"//*[contains(concat(' ', normalize-space(@class), ' '), ' {name} ')]"
+
+
+_TOP_ITEM_LINKS_XPATH = lxml.etree.XPath(
+    f"({_with_class('top-item')})[1]/descendant::a[position() <= $count]"
+)
+_PAGINATION_LINKS_XPATH = lxml.etree.XPath(f"({_with_class('pagination')})[1]//a")
+_DATA_FIELD_XPATH = lxml.etree.XPath("(//*[@data-field=$field])[1]/descendant::td[2]")
+
 
 class ListParsingException(Exception):
     pass
@@ -28,7 +60,7 @@ class NoHTTPSessionException(Exception):
 class Parser(ABC):
     def __init__(self) -> None:
         self.session: Optional[aiohttp.ClientSession] = None
-        self.soup: Optional[bs4.BeautifulSoup] = None
+        self.tree: Optional[lxml.html.HtmlElement] = None
 
     def set_session(self, session: aiohttp.ClientSession) -> None:
         self.session = session
@@ -39,13 +71,11 @@ class Parser(ABC):
             return await html.text()
         raise NoHTTPSessionException()
 
-    async def soup_page(self, num: int) -> bs4.BeautifulSoup:
-        return bs4.BeautifulSoup(
-            await self.get_html(self.get_url(num)), features="lxml"
-        )
+    async def parse_page(self, num: int) -> lxml.html.HtmlElement:
+        return lxml.html.fromstring(await self.get_html(self.get_url(num)))
 
     async def get_item(self, num: int) -> tuple[int, Item]:
-        self.soup = await self.soup_page(num)
+        self.tree = await self.parse_page(num)
         return self.create_item(num)
 
     @abstractmethod
@@ -61,39 +91,38 @@ class ListParser(Parser):
     def __init__(self, img_type: type[Item]):
         super().__init__()
         self.url: str = consts.get_const(img_type, "LIST_URL_TEMPLATE")
+        self.first_page: Optional[str] = None
 
     def get_url(self, num: int) -> str:
         return f"{self.url}{num}"
 
     async def get_page(self, num: int) -> list[int]:
-        nums: list[int] = []
-        pattern: re.Pattern[str] = re.compile(r"/([0-9]+)/")
-
-        page: bs4.BeautifulSoup = await self.soup_page(num)
-        items: bs4.ResultSet[bs4.Tag] = page.find_all(class_="top-item")
-
-        for item in items:
-            if (
-                isinstance(found := item.find("a"), bs4.Tag)
-                and isinstance(string := found.get("href"), str)
-                and isinstance(match := pattern.search(string), re.Match)
-            ):
-                group: str = match.group(1)
-                nums.append(int(group))
+        html: str
+        if num == 1 and self.first_page is not None:
+            html = self.first_page
+        else:
+            html = await self.get_html(self.get_url(num))
+
+        nums: list[int] = [
+            int(match.group(3))
+            for match in _LIST_HREF_RE.finditer(html)
+            if _stays_open(match.group(1).lower(), match.group(2))
+        ]
 
         if nums:
             return sorted(nums, reverse=True)
         raise ListParsingException()
 
     async def get_num_pages(self) -> int:
-        pattern: re.Pattern[str] = re.compile(r"=([0-9]+)")
-
-        page: bs4.BeautifulSoup = await self.soup_page(1)
+        self.first_page = await self.get_html(self.get_url(1))
+        page: lxml.html.HtmlElement = lxml.html.fromstring(self.first_page)
+        links: list[lxml.html.HtmlElement] = cast(
+            list[lxml.html.HtmlElement], _PAGINATION_LINKS_XPATH(page)
+        )
         if (
-            isinstance(item := page.find(class_="pagination"), bs4.Tag)
-            and (links := item.find_all("a"))
+            len(links) > 1
             and isinstance(string := links[-2].get("href"), str)
-            and isinstance(match := pattern.search(string), re.Match)
+            and isinstance(match := _PAGE_PARAM_RE.search(string), re.Match)
         ):
             return int(match.group(1))
 
@@ -126,36 +155,35 @@ class CardParser(Parser):
         return num, new_card
 
     def get_item_image_urls(self) -> tuple[str, str]:
-        if (
-            self.soup
-            and isinstance(top_item := self.soup.find(class_="top-item"), bs4.Tag)
-            and (links := top_item.find_all("a"))
-            and isinstance(first := links[0].get("href"), str)
-            and isinstance(second := links[1].get("href"), str)
-        ):
-            return (first, second)
-
-        raise ItemParsingException()
-
-    def get_data_field(self, field: str) -> bs4.Tag:
-
-        if (
-            self.soup
-            and isinstance(data := self.soup.find(attrs={"data-field": field}), bs4.Tag)
-            and isinstance(res := data.find_all("td")[1], bs4.Tag)
+        if self.tree is None:
+            raise ItemParsingException()
+
+        try:
+            links: list[lxml.html.HtmlElement] = cast(
+                list[lxml.html.HtmlElement], _TOP_ITEM_LINKS_XPATH(self.tree, count=2)
+            )
+            return (links[0].attrib["href"], links[1].attrib["href"])
+        except (IndexError, KeyError) as exception:
+            raise ItemParsingException() from exception
+
+    def get_data_field(self, field: str) -> lxml.html.HtmlElement:
+        if self.tree is not None and (
+            data := cast(
+                list[lxml.html.HtmlElement], _DATA_FIELD_XPATH(self.tree, field=field)
+            )
         ):
-            return res
+            return data[0]
 
         raise ItemParsingException()
 
     def get_item_info(self, info: str) -> str:
         if info == "idol":
-            data: bs4.Tag = self.get_data_field("idol")
-            if isinstance(found_data := data.find("span"), bs4.Tag):
-                return found_data.get_text().partition("Open idol")[0].strip()
+            data: lxml.html.HtmlElement = self.get_data_field("idol")
+            if (found_data := data.find(".//span")) is not None:
+                return found_data.text_content().partition("Open idol")[0].strip()
 
-        data: bs4.Tag = self.get_data_field(info)
-        return data.get_text().strip()
+        data: lxml.html.HtmlElement = self.get_data_field(info)
+        return data.text_content().strip()
 
 
 class StillParser(Parser):
@@ -172,13 +200,13 @@ class StillParser(Parser):
         return num, new_item
 
     def get_item_image_url(self) -> str:
-        if (
-            isinstance(self.soup, bs4.BeautifulSoup)
-            and isinstance(top_item := self.soup.find(class_="top-item"), bs4.Tag)
-            and (links := top_item.find_all("a"))
-        ):
-            link: str = links[0].get("href")
-
-            return link
-
-        raise ItemParsingException()
+        if self.tree is None:
+            raise ItemParsingException()
+
+        try:
+            links: list[lxml.html.HtmlElement] = cast(
+                list[lxml.html.HtmlElement], _TOP_ITEM_LINKS_XPATH(self.tree, count=1)
+            )
+            return links[0].attrib["href"]
+        except (IndexError, KeyError) as exception:
+            raise ItemParsingException() from exception
@@ -0,0 +1,45 @@
+import asyncio
+import gc
+import logging
+
+import pytest
+
+import src.classes
+import src.html_parser
+from src.downloader import Downloader
+
+
+class FakeListParser:
+    def __init__(self, pages):
+        self.pages = pages
+
+    async def get_num_pages(self):
+        return len(self.pages)
+
+    async def get_page(self, num):
+        page = self.pages[num - 1]
+        if isinstance(page, Exception):
+            raise page
+        return page
+
+
+class FailingItemParser:
+    async def get_item(self, num):
+        await asyncio.sleep(0.01)
+        raise src.html_parser.ItemParsingException()
+
+
+@pytest.mark.asyncio
+async def test_prefetch_is_cleaned_up_on_item_error(tmp_path, caplog):
+    downloader = Downloader(tmp_path, src.classes.Still)
+    downloader.list_parser = FakeListParser(
+        [[2, 1], src.html_parser.ListParsingException()]
+    )
+    downloader.item_parser = FailingItemParser()
+
+    with pytest.raises(src.html_parser.ItemParsingException):
+        await downloader.get_cards_from_parser()
+
+    await asyncio.sleep(0)
+    gc.collect()
+    assert not [r for r in caplog.records if r.levelno >= logging.ERROR]
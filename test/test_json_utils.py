@@ -0,0 +1,55 @@
+import src.classes
+import src.json_utils
+
+cards = {
+    2: src.classes.Card(
+        2,
+        "高坂 穂乃果",
+        "UR",
+        "Smile",
+        "µ's",
+        "Printemps",
+        "Second",
+        "//i.idol.st/2x/normal.png",
+        "//i.idol.st/2x/idolized.png",
+    ),
+    1: src.classes.Card(
+        1,
+        "Name",
+        "Rare",
+        "Pure",
+        "Aqours",
+        "CYaRon!",
+        "First",
+        "//i.idol.st/normal.jpeg",
+        "//i.idol.st/idolized.jpeg",
+    ),
+}
+stills = {
+    3: src.classes.Still(3, "//i.idol.st/still.png"),
+}
+
+
+def test_cards_round_trip(tmp_path):
+    src.json_utils.dump_to_file(
+        src.json_utils.to_json(cards), tmp_path, src.classes.Card
+    )
+    loaded = {}
+    src.json_utils.read_json_file(tmp_path, loaded, src.classes.Card)
+    assert loaded == cards
+    assert list(loaded) == list(cards)
+
+
+def test_stills_round_trip(tmp_path):
+    src.json_utils.dump_to_file(
+        src.json_utils.to_json(stills), tmp_path, src.classes.Still
+    )
+    loaded = {}
+    src.json_utils.read_json_file(tmp_path, loaded, src.classes.Still)
+    assert loaded == stills
+
+
+def test_json_layout_is_unchanged():
+    assert src.json_utils.to_json(stills) == (
+        '{\n    "3": {\n        "key": 3,\n        "url": "//i.idol.st/still.png"\n    }\n}'
+    )
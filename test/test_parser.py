@@ -23,6 +23,19 @@ num_pages_payload = MockResponse(
     """,
     200,
 )
+first_page_payload = MockResponse(
+    """
+    <div class='top-item'>
+        <a href='/123/'></a>
+    </div>
+    <div class='pagination'>
+        <a href='=1'></a>
+        <a href='=42'></a>
+        <a href='last'></a>
+    </div>
+    """,
+    200,
+)
 card_payload = MockResponse(
     """
     <div class='top-item'>
@@ -92,6 +105,59 @@ async def test_list_parser(mocker):
         assert await parser.parser.get_page(1) == [123]
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "html, expected",
+    [
+        ('<div class="top-item"><a href="/allstars/card/7/x/"></a></div>', [7]),
+        ('<div class="col top-item card"><a href="/7/"></a></div>', [7]),
+        ("<DIV CLASS='top-item'><A HREF='/7/'></A></DIV>", [7]),
+        (
+            """
+            <div class="top-item">
+                <div class="image"><span>New</span>
+                    <a class="link" href="/allstars/card/7/x/"><img src="/1/"></a>
+                </div>
+                <a href="/8/"></a>
+            </div>
+            <div class="top-item"><a href="/9/"></a></div>
+            """,
+            [9, 7],
+        ),
+        (
+            """
+            <div class="top-item"><div class="empty"></div></div>
+            <div class="other"><a href="/5/"></a></div>
+            <div class="top-item"><a href="/6/"></a></div>
+            """,
+            [6],
+        ),
+        (
+            """
+            <div class="top-item"></div>
+            <div class="top-item"><a href="/6/"></a></div>
+            """,
+            [6],
+        ),
+        (
+            """
+            <div data-class="top-item"><a href="/5/"></a></div>
+            <div class="top-items"><a href="/4/"></a></div>
+            <div class="top-item"><a href="/6/"></a></div>
+            """,
+            [6],
+        ),
+    ],
+)
+async def test_list_parser_markup(mocker, html, expected):
+    mocker.patch(
+        "src.html_parser.aiohttp.ClientSession.get",
+        return_value=awaitable_res(MockResponse(html, 200)),
+    )
+    async with Parser(src.html_parser.ListParser(src.classes.Card)) as parser:
+        assert await parser.parser.get_page(1) == expected
+
+
 @pytest.mark.asyncio
 async def test_num_pages_parser(mocker):
     mocker.patch(
@@ -102,6 +168,18 @@ async def test_num_pages_parser(mocker):
         assert await parser.parser.get_num_pages() == 42
 
 
+@pytest.mark.asyncio
+async def test_list_parser_reuses_first_page(mocker):
+    get = mocker.patch(
+        "src.html_parser.aiohttp.ClientSession.get",
+        return_value=awaitable_res(first_page_payload),
+    )
+    async with Parser(src.html_parser.ListParser(src.classes.Card)) as parser:
+        assert await parser.parser.get_num_pages() == 42
+        assert await parser.parser.get_page(1) == [123]
+        assert get.call_count == 1
+
+
 @pytest.mark.asyncio
 async def test_card_parser(mocker):
     mocker.patch(
@@ -0,0 +1,10 @@
+from typing import Any, Mapping, Optional
+
+class _Element:
+    @property
+    def attrib(self) -> Mapping[str, str]: ...
+    def get(self, key: str, default: Optional[str] = ...) -> Optional[str]: ...
+
+class XPath:
+    def __init__(self, path: str, *, smart_strings: bool = ...) -> None: ...
+    def __call__(self, _etree_or_element: _Element, **_variables: Any) -> Any: ...
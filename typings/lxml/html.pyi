@@ -0,0 +1,9 @@
+from typing import Optional
+
+from lxml.etree import _Element
+
+class HtmlElement(_Element):
+    def find(self, path: str) -> Optional[HtmlElement]: ...
+    def text_content(self) -> str: ...
+
+def fromstring(html: str) -> HtmlElement: ...